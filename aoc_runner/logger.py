@@ -1,20 +1,48 @@
-import datetime
-import rich
-from dataclasses import dataclass
-from typing import NoReturn, Any
+from __future__ import annotations
+
+import sys
+import time
+from typing import NoReturn, Any, Callable
+
+rich_print: Callable[..., None] | None = None  # imported on first use, rich is slow to import
+
+_now = time.time
+_STRFTIME_CACHE: dict[int, str] = {}  # only ever holds the current second
+
+
+def timestamp() -> str:
+    # Same format as str(datetime.datetime.now()), the strftime part is only redone once a second
+    now = _now()
+    second = int(now)
+    date = _STRFTIME_CACHE.get(second)
+    if date is None:
+        _STRFTIME_CACHE.clear()
+        date = _STRFTIME_CACHE[second] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+    return f"{date}.{int((now - second) * 1_000_000):06d}"
 
 
-@dataclass
 class Logger:
+    def __repr__(self) -> str:
+        return "Logger()"  # what the dataclass used to show in the logs
+
     @staticmethod
     def fmt(prefix: str, *objects, **kwargs) -> None:
-        rich.print(
-            f"{datetime.datetime.now()} | [{prefix}]{(' | '+', '.join(repr(thing) for thing in objects)) * bool(objects)}{((' | '+repr(kwargs)))*bool(kwargs)}"
-        )
+        global rich_print
+        if rich_print is None:
+            from rich import print as _rich_print
+
+            rich_print = _rich_print
+
+        message = f"{timestamp()} | [{prefix}]"
+        if objects:
+            message += " | " + ", ".join(map(repr, objects))
+        if kwargs:
+            message += f" | {kwargs!r}"
+        rich_print(message)
 
     def info(self, *objects: Any, **kwargs: Any) -> None:
         self.fmt("INFO", *objects, **kwargs)
 
-    def error(self, error_type: Exception, *objects: Any, **kwargs: Any) -> NoReturn:
+    def error(self, error_type: type[Exception], *objects: Any, **kwargs: Any) -> NoReturn:
         self.fmt(f"ERROR:{error_type}", *objects, **kwargs)
-        exit(1)
+        sys.exit(1)
@@ -4,7 +4,7 @@ A python module for running AOC solutions with a certain project structure being
 solutions/
     year/
         problem_num/
-            input # problem input file, the file handle object (TextIOWrapper) will be automatically provided as the 1st positional arg (after cls)
+            input # problem input file, read into an in-memory file object (StringIO, or BytesIO with --binary) that will be automatically provided as the 1st positional arg (after cls)
             solution.py 
                 # 
                 class Solution:
@@ -15,24 +15,39 @@ solutions/
                     def part_2(cls, file)
                 #
 
+The problem directory is put first on the import path, but the CWD is left alone unless --chdir is given,
+so files next to solution.py should be found via pathlib.Path(__file__).parent.
+Relative paths in $ENV:AOC_SOLUTION_DEPENDENCY_PATHS are relative to the problem directory (e.g. ../../lib),
+same as back when run() always changed the CWD there.
+
 The part_{n} methods can also accept an optional `logger` (structlog) argument.
 
-Run via: run.py {year} {problem_num} {part} [you can provide additional args and kwargs]
+Run via: runner.py {year} {problem_num} {part} [--inputname NAME] [--classname NAME] [--logging] [--binary] [--chdir] [--profile]
+    [--arg VALUE]... [--kw KEY=VALUE]...
+where VALUEs are python literals passed on to part_{n} as additional args and kwargs
 """
 
-import fire
+from __future__ import annotations
+
+import argparse
 import logger
+import functools
+import importlib.machinery
+import io
 import importlib.util
+import py_compile
 import sys
 import os
 import pathlib
-import pyperclip
+import socket
+import stat
 import time
 import ast
-from typing import Any, Callable, TypeVar
-from types import ModuleType
+import contextlib
+from typing import Any, Callable, Iterator, TypeVar
+from types import CodeType, ModuleType
 
-T: TypeVar = TypeVar("T")
+T = TypeVar("T")
 
 LOGGER: logger.Logger = logger.Logger()  # Configuring left to the user xd
 
@@ -40,56 +55,269 @@ SOLUTION_ENV_VAR_NAME: str = "AOC_SOLUTION_DIRECTORY_PATH"
 
 if SOLUTION_ENV_VAR_NAME in os.environ:
     SOLUTION_DIRECTORY_PATH = pathlib.Path(os.environ[SOLUTION_ENV_VAR_NAME]).resolve()
+    SOLUTION_DIRECTORY_PATH_STR: str = str(SOLUTION_DIRECTORY_PATH)
 else:
     raise KeyError(
         f"Set the \x1B[38;5;129m$ENV:{SOLUTION_ENV_VAR_NAME}\x1B[39m environment variable to be the path to the directory with your python solutions."
     )
 
 DEP_VAR_NAME: str = "AOC_SOLUTION_DEPENDENCY_PATHS"
-SOLUTION_DEPENDENCIES: list[str] = ast.literal_eval(os.environ.get(DEP_VAR_NAME, "[]"))
+SOLUTION_DEPENDENCIES: str | list[Any] = ast.literal_eval(os.environ.get(DEP_VAR_NAME, "[]"))
+
+CACHE_DIRECTORY: str = os.path.join(os.path.expanduser("~"), ".cache", "aoc_runner")
+
+CLIPBOARD_LIMIT: int = 4096  # characters, larger results go to LARGE_RESULT_PATH instead
+LARGE_RESULT_PATH: str = os.path.join(CACHE_DIRECTORY, "last_result.txt")
+
+SERVER_VAR_NAME: str = "AOC_SERVER_ADDRESS"
+SERVER_ADDRESS: str | tuple[str, int]
+if hasattr(socket, "AF_UNIX"):
+    # A socket file only its owner can connect to
+    SERVER_ADDRESS = os.environ.get(SERVER_VAR_NAME, os.path.join(CACHE_DIRECTORY, "server.sock"))
+else:
+    host, _, port = os.environ.get(SERVER_VAR_NAME, "127.0.0.1:8042").rpartition(":")
+    SERVER_ADDRESS = (host, int(port))
+    del host, port
 
 
 def path_fmt(path: str | pathlib.Path):
-    return f"{pathlib.Path(path)}".replace("\\", "/")
+    return os.fspath(path).replace("\\", "/")
 
 
 def name_in_function(function: Callable[..., T], arg_name: str) -> bool:
-    return arg_name in function.__code__.co_varnames
+    return name_in_code(function.__code__, arg_name)
 
 
-def add_import_paths(*paths: (str | pathlib.Path) | list[str | pathlib.Path]) -> None:
-    for path_s in paths:
-        if isinstance(path_s, (str, pathlib.Path)):
-            path = str(path_s)
+# Keyed on the code object, not the function, so the cache doesnt keep old solution modules alive
+@functools.lru_cache(maxsize=256)
+def name_in_code(code: CodeType, arg_name: str) -> bool:
+    # co_varnames starts with the parameters, followed by locals which shouldnt count
+    return arg_name in code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
 
-            if pathlib.Path(path).exists():
-                LOGGER.info(f"Added {path_fmt(path)} to import paths")
-            else:
-                LOGGER.error(
-                    FileNotFoundError,
-                    f"The dependency path {path_fmt(path)} doesnt exist",
-                )
 
-            if path not in sys.path:
-                sys.path.append(path)
+_PATH_SET: set[str] = set(sys.path)  # mirror of sys.path for O(1) membership checks
+_ADDED_PATHS: list[str] = []  # what add_import_paths put on sys.path, so it can be taken back off
+
+
+def flatten_paths(paths: Any) -> list[str]:
+    # Flattening with a stack instead of recursing, keeps the order the paths were given in
+    # a bare str or PathLike is a single path, not a sequence of characters
+    flat: list[str] = []
+    stack = [paths]
+    while stack:
+        path_s = stack.pop()
+        if isinstance(path_s, (list, tuple)):
+            stack.extend(reversed(path_s))
         else:
-            for path in path_s:
-                add_import_paths(path)
+            flat.append(os.fspath(path_s))
+    return flat
+
+
+def insert_import_path(path: str) -> None:
+    sys.path.insert(0, path)  # in front, so solution imports are found on the first try
+    _PATH_SET.add(path)
+    _ADDED_PATHS.append(path)
+
+
+def add_import_paths(*paths: (str | pathlib.Path) | list[str | pathlib.Path]) -> None:
+    # The last path given ends up first on sys.path
+    for path in flatten_paths(paths):
+        if path in _PATH_SET:
+            continue
+
+        if os.path.exists(path):
+            LOGGER.info(f"Added {path_fmt(path)} to import paths")
+        else:
+            LOGGER.error(
+                FileNotFoundError,
+                f"The dependency path {path_fmt(path)} doesnt exist",
+            )
+
+        insert_import_path(path)
+
+
+def resolve_dependencies(paths: Any, directory: str) -> tuple[str, ...]:
+    """
+    Resolves the dependency paths, relative ones against `directory`, and checks that they exist
+    """
+    resolved: list[str] = []
+    for path in flatten_paths(paths):
+        real_path = os.path.realpath(os.path.join(directory, path))
+        try:
+            os.stat(real_path)
+        except OSError:
+            LOGGER.error(FileNotFoundError, f"The dependency path {path_fmt(path)} doesnt exist")
+        resolved.append(real_path)
+    return tuple(resolved)
 
 
-def import_by_path(path: str | pathlib.Path, name: str = "<dynamic>") -> ModuleType:
+_RESOLVED_DEPS: dict[str, tuple[str, ...]] = {}  # problem directory -> its resolved dependency paths
+
+
+def add_dependency_paths(problem_directory: str) -> None:
+    # Resolved once per problem directory, so repeated runs dont have to stat them again
+    resolved = _RESOLVED_DEPS.get(problem_directory)
+    if resolved is None:
+        resolved = _RESOLVED_DEPS[problem_directory] = resolve_dependencies(SOLUTION_DEPENDENCIES, problem_directory)
+    for path in resolved:
+        if path not in _PATH_SET:
+            insert_import_path(path)
+
+
+def modules_imported_since(already_imported: set[str]) -> dict[str, ModuleType]:
+    """
+    The modules that came from the added import paths after `already_imported` (a set(sys.modules)) was taken,
+    modules from before that are left alone even if they live there, a dependency path can hold a venv or the stdlib
+    """
+    prefixes = tuple(os.path.join(path, "") for path in _ADDED_PATHS)
+    return {
+        name: module
+        for name, module in list(sys.modules.items())
+        if name not in already_imported
+        and isinstance(file := getattr(module, "__file__", None), str)
+        and file.startswith(prefixes)
+    }
+
+
+_RUN_MODULES: set[str] = set()  # what the solutions imported from the import paths, dropped on the next reset
+
+
+@contextlib.contextmanager
+def track_imports() -> Iterator[None]:
+    already_imported = set(sys.modules)
+    try:
+        yield
+    finally:  # a solution that failed halfway still leaves its imports behind
+        _RUN_MODULES.update(modules_imported_since(already_imported))
+
+
+def reset_import_paths() -> None:
+    """
+    Takes everything add_import_paths and add_dependency_paths added back off sys.path, along with the modules
+    solutions imported from there, so runs in one process dont leak into each other (two days' helper.py and such)
+    """
+    for name in _RUN_MODULES:
+        sys.modules.pop(name, None)
+    _RUN_MODULES.clear()
+    for path in _ADDED_PATHS:
+        if path in sys.path:
+            sys.path.remove(path)
+        _PATH_SET.discard(path)
+    _ADDED_PATHS.clear()
+
+
+def pyc_matches_source(pyc_path: str, source: bytes) -> bool:
+    # The header has to carry the hash of the current source, an mtime only has whole seconds in it
+    # so an edit within the same second that keeps the size would still match
+    try:
+        with open(pyc_path, "rb") as file:
+            header = file.read(16)
+    except OSError:
+        return False
+    return (
+        len(header) == 16
+        and header[:4] == importlib.util.MAGIC_NUMBER
+        and int.from_bytes(header[4:8], "little") == 0b11  # hash based & checked
+        and header[8:16] == importlib.util.source_hash(source)
+    )
+
+
+def compile_cached(path: str) -> str | None:
+    """
+    Returns the path to an up to date .pyc of `path`, compiling it first if its missing or doesnt match the source
+    None if the bytecode shouldnt (sys.dont_write_bytecode) or cant be written (read-only dirs and such)
+    """
+    if sys.dont_write_bytecode:
+        return None
+    pyc_path = importlib.util.cache_from_source(path)
+    with open(path, "rb") as file:
+        source = file.read()
+    if pyc_matches_source(pyc_path, source):
+        return pyc_path
+
+    try:
+        return py_compile.compile(
+            path, cfile=pyc_path, doraise=True, invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH
+        )
+    except OSError:
+        return None
+
+
+# absolute path -> (st_mtime_ns, module, what it imported from the import paths as (name, module, file, st_mtime_ns))
+_MOD_CACHE: dict[str, tuple[int, ModuleType, tuple[tuple[str, ModuleType, str, int], ...]]] = {}
+
+
+def helpers_unchanged(helpers: tuple[tuple[str, ModuleType, str, int], ...]) -> bool:
+    for _, _, file, mtime in helpers:
+        try:
+            if os.stat(file).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def import_by_path(
+    path: str | pathlib.Path, name: str = "<dynamic>", mtime: int | None = None
+) -> ModuleType:
     """
     Function for dynamic loading of modules by an absolute path, slightly cursed
+    Modules are cached by path and only re-executed when the file's mtime changes (or the mtime of anything it
+    imported from the added import paths), pass `mtime` (st_mtime_ns) if the file was already stat'ed to skip doing it again
     """
-    spec = importlib.util.spec_from_file_location(
-        name, str(path)
-    )  # str(path) incase path is a pathlib path
-    mod = importlib.util.module_from_spec(spec)
-    sys.modules[name] = mod
-    spec.loader.exec_module(mod)
+    key = os.path.abspath(path)  # no syscalls, unlike realpath which lstats every component
+    if mtime is None:
+        mtime = os.stat(key).st_mtime_ns
+    cached = _MOD_CACHE.get(key)
+    if cached is not None and cached[0] == mtime and helpers_unchanged(cached[2]):
+        sys.modules[name] = cached[1]
+        for helper_name, helper, _, _ in cached[2]:
+            sys.modules[helper_name] = helper  # the same helper objects the cached module is holding on to
+        return cached[1]
+
+    importlib.invalidate_caches()
+    # Skipping the spec machinery, the loader can execute straight into a bare module
+    pyc_path = compile_cached(key)
+    loader: importlib.machinery.SourceFileLoader | importlib.machinery.SourcelessFileLoader
+    if pyc_path is None:
+        loader = importlib.machinery.SourceFileLoader(name, key)
+    else:
+        loader = importlib.machinery.SourcelessFileLoader(name, pyc_path)
+    mod = ModuleType(name)
+    mod.__file__ = key
+    mod.__loader__ = loader
+    already_imported = set(sys.modules)
+    sys.modules[name] = mod  # registered before executing so re-entrant imports find it
+    loader.exec_module(mod)
+    helpers = tuple(
+        (helper_name, helper, helper.__file__, os.stat(helper.__file__).st_mtime_ns)
+        for helper_name, helper in modules_imported_since(already_imported).items()
+        if helper is not mod and helper.__file__ is not None
+    )
+    _MOD_CACHE[key] = (mtime, mod, helpers)
     return mod
 
 
+_INPUT_CACHE: dict[str, tuple[int, bytes]] = {}  # path -> (st_mtime_ns, contents)
+
+
+def read_input(path: str) -> bytes:
+    """
+    Reads the whole file in one go, repeated reads of an unchanged file dont touch the disk
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _INPUT_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    # Unbuffered raw file, the whole thing is read in one readall() so the buffer & text layers would be dead weight
+    flags = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+    with io.FileIO(os.open(path, flags), "r", closefd=True) as file:
+        data = file.readall()
+    _INPUT_CACHE[path] = (mtime, data)
+    return data
+
+
 def run(
     year: int,
     problem_num: int,
@@ -97,74 +325,246 @@ def run(
     inputname: str = "input",
     classname: str = "Solution",
     logging: bool = False,
+    binary: bool = False,
+    chdir: bool = False,
+    profile: bool = False,
     args: tuple[Any, ...] = (),
     kwargs: dict[str, Any] = {},
 ) -> None:
     # Relying on a certain file structure to get the files based on arguments
-    problem_directory = SOLUTION_DIRECTORY_PATH / str(year) / str(problem_num)
-    if problem_directory.exists():
-        LOGGER.info(f"Found {path_fmt(problem_directory)}")
-    else:
+    problem_directory = os.path.join(SOLUTION_DIRECTORY_PATH_STR, str(year), str(problem_num))
+    try:
+        problem_directory_mode = os.stat(problem_directory).st_mode
+    except FileNotFoundError:
         LOGGER.error(
             FileNotFoundError,
             f"{path_fmt(problem_directory)} is not found, check your environment variables and stuff",
         )
+    except NotADirectoryError:  # a file somewhere along the path
+        LOGGER.error(NotADirectoryError, f"{path_fmt(problem_directory)} is not a directory")
+    except OSError as e:  # PermissionError and friends
+        LOGGER.error(type(e), f"Couldnt access {path_fmt(problem_directory)}", e)
+    if stat.S_ISDIR(problem_directory_mode):
+        LOGGER.info(f"Found {path_fmt(problem_directory)}")
+    else:
+        LOGGER.error(NotADirectoryError, f"{path_fmt(problem_directory)} is not a directory")
+
+    # Put back afterwards, otherwise every later run in the shell or server would inherit it
+    with contextlib.chdir(problem_directory) if chdir else contextlib.nullcontext():
+        if chdir:
+            LOGGER.info(f"Set CWD to {path_fmt(problem_directory)}")
+
+        reset_import_paths()
+        add_dependency_paths(problem_directory)
+        if problem_directory not in _PATH_SET:
+            insert_import_path(problem_directory)  # already stat'ed above, add_import_paths would check it again
+            LOGGER.info(f"Added {path_fmt(problem_directory)} to import paths")
+
+        solution_file_path = os.path.join(problem_directory, "solution.py")
+        problem_input_file_path = os.path.join(problem_directory, inputname)
+
+        try:
+            solution_mtime = os.stat(solution_file_path).st_mtime_ns
+        except OSError:
+            LOGGER.error(FileNotFoundError, f"{path_fmt(solution_file_path)} does not exist")
+
+        if profile:
+            import cProfile
+            import pstats
+
+        # Whatever the solution imports from the import paths goes again on the next reset
+        with track_imports():
+            # Dynamically loading the module with the solution & gettattring the function from it
+            try:
+                solution_module = import_by_path(
+                    solution_file_path, f"aoc_{year}_{problem_num}_solution", solution_mtime
+                )
+                LOGGER.info(f"Loaded {path_fmt(solution_file_path)}")
+            except Exception as e:  # the file exists, so its SyntaxError, ImportError and such from loading it
+                import traceback
+
+                traceback.print_exc()
+                LOGGER.error(type(e), f"Couldnt load {path_fmt(solution_file_path)}", e)
+
+            try:
+                solution_class = getattr(solution_module, classname)
+                LOGGER.info(f"Found class {classname}")
+            except AttributeError:
+                LOGGER.error(AttributeError, f"{classname} doesnt exist in {solution_file_path}")
+
+            func_name: str = f"part_{part}"
+            try:
+                part_function = getattr(solution_class, func_name)
+                LOGGER.info(f"Found function {func_name}")
+            except AttributeError:
+                LOGGER.error(AttributeError, f"Didnt find {func_name} in the {classname} class")
+        
+            solution_class.logging = logging
+            if logging:
+                solution_class.logger = LOGGER
+                LOGGER.info(f"Set {classname}.logger to", LOGGER)
+            else:
+                solution_class.logger = None
+                LOGGER.info(f"Set {classname}.logger to", None)
+            LOGGER.info(f"Set {classname}.logging to", logging)
 
-    os.chdir(str(problem_directory))
-    LOGGER.info(f"Set CWD to {path_fmt(problem_directory)}")
-
-    add_import_paths(SOLUTION_DEPENDENCIES, problem_directory)
 
-    solution_file_path = problem_directory / "solution.py"
-    problem_input_file_path = problem_directory / inputname
+            try:
+                problem_input = read_input(problem_input_file_path)
+            except OSError:
+                LOGGER.error(FileNotFoundError, f"{path_fmt(problem_input_file_path)} does not exist")
 
-    # Dynamically loading the module with the solution & gettattring the function from it
+            # Running the solution, providing the input as an in-memory file as first argument
+            problem_file: io.BytesIO | io.StringIO
+            if binary:
+                problem_file = io.BytesIO(problem_input)
+            else:
+                problem_file = io.StringIO(problem_input.decode(), newline=None)  # same newline handling as open()
+            LOGGER.info(f"Running {path_fmt(solution_file_path)}")
+            if profile:
+                profiler = cProfile.Profile()
+                start_ns = time.perf_counter_ns()
+                solution_result = profiler.runcall(part_function, problem_file, *args, **kwargs)
+                end_ns = time.perf_counter_ns()
+                pstats.Stats(profiler, stream=sys.stdout).sort_stats(pstats.SortKey.CUMULATIVE).print_stats()
+            else:
+                start_ns = time.perf_counter_ns()
+                solution_result = part_function(problem_file, *args, **kwargs)
+                end_ns = time.perf_counter_ns()
+        LOGGER.info(f"Finished in {(end_ns - start_ns) / 1_000_000:.3f}ms")
+        LOGGER.info(year=year, problem_num=problem_num, part=part, result=solution_result)
+
+        result_repr = repr(solution_result)
+        if len(result_repr) > CLIPBOARD_LIMIT:
+            # Piping megabytes through xclip & co is slow and nobody pastes that into the answer box anyway
+            os.makedirs(os.path.dirname(LARGE_RESULT_PATH), exist_ok=True)
+            with open(LARGE_RESULT_PATH, "w", encoding="utf-8") as file:
+                file.write(result_repr)
+            LOGGER.info(f"Result is too large for the clipboard, wrote it to {path_fmt(LARGE_RESULT_PATH)}")
+            return
+
+        try:
+            import pyperclip  # type: ignore[import-untyped]  # only needed here, no point paying for it on every import
+
+            pyperclip.copy(result_repr)
+        except Exception as e:  # missing module or no clipboard mechanism, neither is worth dying over
+            LOGGER.info("Couldnt copy the result to the clipboard", e)
+
+
+def literal(value: str) -> Any:
     try:
-        solution_module = import_by_path(solution_file_path)
-        LOGGER.info(f"Loaded {path_fmt(solution_file_path)}")
-    except Exception:
-        LOGGER.error(FileNotFoundError, f"{path_fmt(solution_file_path)} does not exist")
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return value  # bare words stay strings, same as fire did
+
+
+def keyword(pair: str) -> tuple[str, Any]:
+    key, sep, value = pair.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got {pair!r}")
+    return key, literal(value)
+
+
+def parse_args(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description="Run an AOC solution")
+    parser.add_argument("year", type=int)
+    parser.add_argument("problem_num", type=int)
+    parser.add_argument("part", type=int)
+    parser.add_argument("--inputname", default="input")
+    parser.add_argument("--classname", default="Solution")
+    parser.add_argument("--logging", action="store_true")
+    parser.add_argument("--binary", action="store_true", help="pass the input as bytes")
+    parser.add_argument(
+        "--chdir", action="store_true", help="set the CWD to the problem directory, for older solutions"
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="run the solution under cProfile and print the stats"
+    )
+    parser.add_argument(
+        "--no-server", action="store_true", help="run in this process even if a server is up"
+    )
+    parser.add_argument(
+        "--arg", dest="args", metavar="VALUE", type=literal, action="append", default=[]
+    )
+    parser.add_argument(
+        "--kw", dest="kwargs", metavar="KEY=VALUE", type=keyword, action="append", default=[]
+    )
 
-    try:
-        solution_class = getattr(solution_module, classname)
-        LOGGER.info(f"Found class {classname}")
-    except AttributeError:
-        LOGGER.error(AttributeError, f"{classname} doesnt exist in {solution_file_path}")
+    parsed = vars(parser.parse_args(argv))
+    parsed["args"] = tuple(parsed["args"])
+    parsed["kwargs"] = dict(parsed["kwargs"])
+    return parsed
 
-    func_name: str = f"part_{part}"
-    try:
-        part_function = getattr(solution_class, func_name)
-        LOGGER.info(f"Found function {func_name}")
-    except AttributeError:
-        LOGGER.error(AttributeError, f"Didnt find {func_name} in the {classname} class")
-        
-    solution_class.logging = logging
-    if logging:
-        solution_class.logger = LOGGER
-        LOGGER.info(f"Set {classname}.logger to", LOGGER)
-    else:
-        solution_class.logger = None
-        LOGGER.info(f"Set {classname}.logger to", None)
-    LOGGER.info(f"Set {classname}.logging to", logging)
+
+STATUS_TRAILER_SIZE: int = 5
 
 
-    # Running the solution, providing the input file handle as first argument
-    problem_file = problem_input_file_path.open()
-    start_time = time.perf_counter()
-    LOGGER.info(f"Running {path_fmt(solution_file_path)}")
-    solution_result = part_function(problem_file, *args, **kwargs)
-    delta_time = time.perf_counter() - start_time
-    LOGGER.info(f"Finished in {delta_time*1000}ms")
-    LOGGER.info(year=year, problem_num=problem_num, part=part, result=solution_result)
+def status_trailer(status: int) -> bytes:
+    # Ends every server response: a NUL byte and the run's exit status
+    return b"\x00" + status.to_bytes(4, "big", signed=True)
 
-    pyperclip.copy(repr(solution_result))
 
-    problem_file.close()
+def connect_to_server() -> socket.socket:
+    if isinstance(SERVER_ADDRESS, str):
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(0.1)
+        try:
+            connection.connect(SERVER_ADDRESS)
+        except OSError:
+            connection.close()
+            raise
+        return connection
+    return socket.create_connection(SERVER_ADDRESS, timeout=0.1)
+
+
+def run_on_server(run_kwargs: dict[str, Any]) -> int | None:
+    """
+    Sends the run to a server.py instance and streams its output back
+    Returns the run's exit status, None if there is no server to talk to or the run cant be sent to it
+    """
+    request = {
+        **run_kwargs,
+        # So the server can refuse runs meant for a different set of solutions
+        "solution_directory": SOLUTION_DIRECTORY_PATH_STR,
+        "solution_dependencies": SOLUTION_DEPENDENCIES,
+    }
+    encoded = f"{request!r}\n"
+    try:
+        ast.literal_eval(encoded)
+    except (ValueError, SyntaxError):  # values whose repr isnt a literal, inf & nan from --arg 1e999 and such
+        return None
+
+    try:
+        connection = connect_to_server()
+    except OSError:
+        return None
+
+    pending = b""  # the trailer is only known to be the trailer once the stream ends, so its held back
+    with connection:
+        connection.settimeout(None)  # solutions can take however long they want
+        connection.sendall(encoded.encode())
+        connection.shutdown(socket.SHUT_WR)
+        while chunk := connection.recv(65536):
+            pending += chunk
+            sys.stdout.buffer.write(pending[:-STATUS_TRAILER_SIZE])
+            sys.stdout.flush()
+            pending = pending[-STATUS_TRAILER_SIZE:]
+
+    if len(pending) != STATUS_TRAILER_SIZE or pending[0] != 0:
+        sys.stdout.buffer.write(pending)
+        LOGGER.fmt("ERROR:ConnectionError", "The server closed the connection without an exit status")
+        return 1
+    return int.from_bytes(pending[1:], "big", signed=True)
 
 
 def main() -> None:
     # Intended to be run directly.
-    fire.Fire(run)
+    run_kwargs = parse_args()
+    status = None if run_kwargs.pop("no_server") else run_on_server(run_kwargs)
+    if status is None:
+        run(**run_kwargs)
+    else:
+        sys.exit(status)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+"""
+A persistent shell around runner.run, so the interpreter startup and the heavy imports are paid once
+instead of once per problem.
+
+Run via: runner_daemon.py, then type {year} {problem_num} {part} [python literal args] [key=python literal kwargs]
+e.g. `2023 1 2 inputname='test_input'`
+"""
+
+import cmd
+import shlex
+import traceback
+import runner
+from typing import Any
+
+
+def parse_line(line: str) -> tuple[tuple[Any, ...], dict[str, Any]]:
+    args: list[Any] = []
+    kwargs: dict[str, Any] = {}
+    for token in shlex.split(line):
+        key, sep, value = token.partition("=")
+        if sep and key.isidentifier():
+            kwargs[key] = runner.literal(value)
+        else:
+            args.append(runner.literal(token))
+    return tuple(args), kwargs
+
+
+class RunnerShell(cmd.Cmd):
+    intro = "AoC runner shell, `{year} {problem_num} {part} [args] [kwargs]` to run, `quit` to exit"
+    prompt = "aoc> "
+
+    def default(self, line: str) -> None:
+        try:
+            args, kwargs = parse_line(line)
+        except ValueError as e:  # unbalanced quotes and such
+            runner.LOGGER.fmt("ERROR:ValueError", e)
+            return
+
+        try:
+            runner.run(*args, **kwargs)
+        except SystemExit:
+            pass  # LOGGER.error exits, the shell should survive it
+        except KeyboardInterrupt:  # Ctrl-C stops a runaway solution, not the shell
+            runner.LOGGER.fmt("ERROR:KeyboardInterrupt", "Run interrupted")
+        except Exception:
+            traceback.print_exc()
+
+    def onecmd(self, line: str) -> bool:
+        command, _, _ = self.parseline(line)
+        if command and not hasattr(self, f"do_{command}"):
+            # cmd would call default from inside its except AttributeError, chaining that onto every traceback
+            self.default(line)
+            return False
+        return super().onecmd(line)
+
+    def emptyline(self) -> bool:
+        return False  # dont repeat the last run on an empty line
+
+    def do_quit(self, _: str) -> bool:
+        return True
+
+    do_EOF = do_quit
+
+
+def main() -> None:
+    RunnerShell().cmdloop()
+
+
+if __name__ == "__main__":
+    main()
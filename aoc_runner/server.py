@@ -0,0 +1,159 @@
+"""
+Keeps one warm process around for runner.run, the runner.py CLI sends its runs here when this is up.
+
+Run via: server.py, it listens on $ENV:AOC_SERVER_ADDRESS, which is a socket file only you can connect to
+(~/.cache/aoc_runner/server.sock by default), or host:port (127.0.0.1:8042 by default) where unix sockets dont exist.
+Each connection sends a single line with the repr of the run() kwargs and gets the run's output back,
+followed by runner.status_trailer() with the exit status the run would have had on its own.
+Runs are only accepted for the same solution directory & dependencies the server was started with.
+"""
+
+import ast
+import io
+import os
+import socketserver
+import contextlib
+import traceback
+import runner
+from typing import Any
+
+# Everything run() accepts over the wire, the types are exact so bools dont pass as ints and such
+RUN_PARAMETERS: dict[str, type] = {
+    "year": int,
+    "problem_num": int,
+    "part": int,
+    "inputname": str,
+    "classname": str,
+    "logging": bool,
+    "binary": bool,
+    "chdir": bool,
+    "profile": bool,
+    "args": tuple,
+    "kwargs": dict,
+}
+REQUIRED_PARAMETERS: tuple[str, ...] = ("year", "problem_num", "part")
+
+
+def validate(request: Any) -> dict[str, Any]:
+    """
+    Turns a request into run() kwargs, raising ValueError/TypeError for anything run() shouldnt be handed
+    """
+    if not isinstance(request, dict):
+        raise TypeError("Expected a dict of run() arguments")
+    run_kwargs = dict(request)
+
+    for key, expected in (
+        ("solution_directory", runner.SOLUTION_DIRECTORY_PATH_STR),
+        ("solution_dependencies", runner.SOLUTION_DEPENDENCIES),
+    ):
+        if run_kwargs.pop(key, None) != expected:
+            raise ValueError(
+                f"This server runs solutions with {key} {expected!r}, restart it or use --no-server"
+            )
+
+    unknown = run_kwargs.keys() - RUN_PARAMETERS.keys()
+    if unknown:
+        raise ValueError(f"Unknown run() arguments {sorted(unknown)}")
+    missing = [key for key in REQUIRED_PARAMETERS if key not in run_kwargs]
+    if missing:
+        raise ValueError(f"Missing run() arguments {missing}")
+    for key, value in run_kwargs.items():
+        if type(value) is not RUN_PARAMETERS[key]:
+            raise TypeError(f"{key} has to be {RUN_PARAMETERS[key].__name__}, got {type(value).__name__}")
+
+    if not all(isinstance(key, str) for key in run_kwargs.get("kwargs", {})):
+        raise TypeError("kwargs keys have to be str")
+    inputname = run_kwargs.get("inputname", "input")
+    if os.path.basename(inputname) != inputname or inputname in ("", ".", ".."):
+        raise ValueError(f"inputname has to be a file in the problem directory, got {inputname!r}")
+    return run_kwargs
+
+
+class SocketOutput(io.TextIOWrapper):
+    def write(self, text: str) -> int:
+        # Output for a client that hung up is dropped, letting the BrokenPipeError through would make rich
+        # go quiet for good & dup2 /dev/null over what it thinks is stdout (the socket), killing the server
+        try:
+            return super().write(text)
+        except OSError:
+            return len(text)
+
+
+class RunHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        # wfile has no .name, which typeshed wants of a TextIOWrapper buffer but only repr() uses
+        output = SocketOutput(self.wfile, encoding="utf-8", write_through=True)  # type: ignore[arg-type]
+        # stderr too, so the client sees tracebacks & warnings like it would running the solution itself
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            status = self.run_request()
+        with contextlib.suppress(OSError):
+            output.detach()  # leave closing the socket file to the handler
+        with contextlib.suppress(OSError):  # the client is gone, nobody left to tell
+            self.wfile.write(runner.status_trailer(status))
+
+    def run_request(self) -> int:
+        try:
+            runner.run(**validate(ast.literal_eval(self.rfile.readline().decode())))
+        except SystemExit as e:  # LOGGER.error exits, the server should survive it
+            return exit_status(e)
+        except Exception:
+            traceback.print_exc()
+            return 1
+        return 0
+
+
+def exit_status(error: SystemExit) -> int:
+    # Same mapping the interpreter uses for sys.exit(code)
+    if error.code is None:
+        return 0
+    if isinstance(error.code, int):
+        return error.code
+    return 1
+
+
+def preload() -> None:
+    # Paying for these before the first request instead of during it
+    import pyperclip  # type: ignore[import-untyped]  # noqa: F401
+
+    runner.LOGGER.info("Preloaded modules")
+
+
+def make_server() -> socketserver.BaseServer:
+    # Not threaded, run() changes sys.path and the solution class so runs have to happen one at a time
+    if not isinstance(runner.SERVER_ADDRESS, str):
+        return socketserver.TCPServer(runner.SERVER_ADDRESS, RunHandler)
+
+    path = runner.SERVER_ADDRESS
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    try:
+        runner.connect_to_server().close()
+    except OSError:
+        pass
+    else:
+        runner.LOGGER.error(OSError, f"A server is already listening on {runner.path_fmt(path)}")
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)  # left behind by a server that didnt shut down cleanly
+
+    previous_umask = os.umask(0o177)  # the socket file is created 0600, connecting needs write permission
+    try:
+        return socketserver.UnixStreamServer(path, RunHandler)
+    finally:
+        os.umask(previous_umask)
+
+
+def main() -> None:
+    preload()
+    address = runner.SERVER_ADDRESS
+    with make_server() as server:
+        shown = runner.path_fmt(address) if isinstance(address, str) else f"{address[0]}:{address[1]}"
+        runner.LOGGER.info(f"Serving on {shown}")
+        try:
+            server.serve_forever()
+        finally:
+            if isinstance(address, str):
+                with contextlib.suppress(OSError):
+                    os.unlink(address)
+
+
+if __name__ == "__main__":
+    main()
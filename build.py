@@ -0,0 +1,34 @@
+"""
+Compiles aoc_runner/runner.py and aoc_runner/logger.py with mypyc for a faster startup.
+The compiled modules are picked up over the .py files automatically, without them the pure python ones are used as before.
+
+Needs the `compiled` extra: pip install .[compiled]
+Run via: build.py [--clean]
+"""
+
+import pathlib
+import shutil
+import subprocess
+import sys
+
+PACKAGE_DIRECTORY: pathlib.Path = pathlib.Path(__file__).resolve().parent / "aoc_runner"
+MODULES: list[str] = ["runner.py", "logger.py"]
+
+
+def build() -> None:
+    subprocess.run([sys.executable, "-m", "mypyc", *MODULES], cwd=PACKAGE_DIRECTORY, check=True)
+
+
+def clean() -> None:
+    # Back to the pure python modules
+    for extension in PACKAGE_DIRECTORY.glob("*.so"):
+        extension.unlink()
+    for extension in PACKAGE_DIRECTORY.glob("*.pyd"):
+        extension.unlink()
+    shutil.rmtree(PACKAGE_DIRECTORY / "build", ignore_errors=True)
+
+
+if __name__ == "__main__":
+    clean()
+    if "--clean" not in sys.argv[1:]:
+        build()